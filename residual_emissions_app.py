@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from plotly.subplots import make_subplots
@@ -13,7 +14,7 @@ st.set_page_config(
 )
 
 # Enhanced CSS for better visuals
-st.markdown("""
+_CSS = """
 <style>
     .metric-container {
         background-color: #f0f2f6;
@@ -29,7 +30,8 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Title with enhanced introduction
 st.title("🎯 Dynamic Residual Emissions: The Science Behind Industry-Specific Thresholds")
@@ -47,33 +49,498 @@ should determine RF4 residual emissions—transforming corporate climate action
 """, unsafe_allow_html=True)
 
 # Enhanced industry data with more nuanced parameters
-industry_profiles = {
-    'Food, Beverage & Tobacco': {
-        'scope3_pct': 67, 'biological_floor': 25, 'tech_ceiling': 88, 'cost_per_ton': 45,
-        'main_constraint': 'Biological methane emissions from ruminants',
-        'key_interventions': ['Regenerative agriculture', 'Alternative proteins', 'Packaging optimization'],
-        'growth_rate_range': (2, 6), 'decarb_efficiency_range': (30, 70)
-    },
-    'Capital Goods': {
-        'scope3_pct': 90, 'biological_floor': 3, 'tech_ceiling': 97, 'cost_per_ton': 120,
-        'main_constraint': '20-30 year equipment lifespans beyond company control',
-        'key_interventions': ['Equipment efficiency', 'Electrification-ready design', 'Smart controls'],
-        'growth_rate_range': (1, 5), 'decarb_efficiency_range': (60, 90)
-    },
-    'Consumer Goods': {
-        'scope3_pct': 85, 'biological_floor': 15, 'tech_ceiling': 85, 'cost_per_ton': 65,
-        'main_constraint': 'Consumer behavior and packaging safety requirements',
-        'key_interventions': ['Circular business models', 'Sustainable packaging', 'Alternative materials'],
-        'growth_rate_range': (2, 7), 'decarb_efficiency_range': (40, 70)
-    },
-    'Financial Services': {
-        'scope3_pct': 99.98, 'biological_floor': 15, 'tech_ceiling': 85, 'cost_per_ton': 25,
-        'main_constraint': 'Portfolio emissions reflect ALL sectors weighted average',
-        'key_interventions': ['Portfolio decarbonization', 'Green finance products', 'Sector-specific strategies'],
-        'growth_rate_range': (3, 8), 'decarb_efficiency_range': (50, 80)
+@st.cache_resource
+def get_industry_profiles():
+    """Read-only industry reference data, built once per process."""
+    return {
+        'Food, Beverage & Tobacco': {
+            'scope3_pct': 67, 'biological_floor': 25, 'tech_ceiling': 88, 'cost_per_ton': 45,
+            'main_constraint': 'Biological methane emissions from ruminants',
+            'key_interventions': ['Regenerative agriculture', 'Alternative proteins', 'Packaging optimization'],
+            'growth_rate_range': (2, 6), 'decarb_efficiency_range': (30, 70),
+            'constraint_reasons': [
+                "Biological methane emissions from ruminants have physical floors",
+                "Seasonal agricultural cycles create supply chain variability",
+                "Food safety packaging requirements limit material substitution",
+                "Global supply chains span multiple climate zones"
+            ]
+        },
+        'Capital Goods': {
+            'scope3_pct': 90, 'biological_floor': 3, 'tech_ceiling': 97, 'cost_per_ton': 120,
+            'main_constraint': '20-30 year equipment lifespans beyond company control',
+            'key_interventions': ['Equipment efficiency', 'Electrification-ready design', 'Smart controls'],
+            'growth_rate_range': (1, 5), 'decarb_efficiency_range': (60, 90),
+            'constraint_reasons': [
+                "Equipment lifespans of 20-30 years beyond manufacturer control",
+                "Use-phase emissions depend on customer operational decisions",
+                "Technology evolution varies dramatically by end-use sector",
+                "Heavy industrial applications have limited electrification options"
+            ]
+        },
+        'Consumer Goods': {
+            'scope3_pct': 85, 'biological_floor': 15, 'tech_ceiling': 85, 'cost_per_ton': 65,
+            'main_constraint': 'Consumer behavior and packaging safety requirements',
+            'key_interventions': ['Circular business models', 'Sustainable packaging', 'Alternative materials'],
+            'growth_rate_range': (2, 7), 'decarb_efficiency_range': (40, 70),
+            'constraint_reasons': [
+                "Consumer behavior patterns resist company influence",
+                "Food safety and shelf-life requirements constrain packaging",
+                "Global material supply chains have embedded constraints",
+                "End-of-life waste management varies by geography"
+            ]
+        },
+        'Financial Services': {
+            'scope3_pct': 99.98, 'biological_floor': 15, 'tech_ceiling': 85, 'cost_per_ton': 25,
+            'main_constraint': 'Portfolio emissions reflect ALL sectors weighted average',
+            'key_interventions': ['Portfolio decarbonization', 'Green finance products', 'Sector-specific strategies'],
+            'growth_rate_range': (3, 8), 'decarb_efficiency_range': (50, 80),
+            'constraint_reasons': [
+                "Portfolio emissions reflect weighted average of ALL sectors",
+                "Each sector has different maximum decarbonization potential",
+                "Indirect influence through capital allocation, not direct control",
+                "Regulatory constraints limit divestment speed"
+            ]
+        }
     }
+
+
+@st.cache_resource
+def get_industry_names():
+    """Industry names in display order for the selector."""
+    return tuple(get_industry_profiles().keys())
+
+
+industry_profiles = get_industry_profiles()
+INDUSTRIES = get_industry_names()
+
+@st.cache_resource
+def register_templates():
+    """Register the app's Plotly templates once per process.
+
+    'decomp' holds the industry-independent decomposition layout and is stacked on the
+    active default by the figure that uses it.
+    """
+    pio.templates['decomp'] = go.layout.Template(layout=go.Layout(
+        xaxis_title="Year",
+        yaxis_title="MtCO₂e (Positive = Emissions, Negative = Removals)",
+        barmode='relative',
+        legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.05),
+        hovermode='x unified'
+    ))
+    return True
+
+
+register_templates()
+
+# Plotly Express fills axis and legend titles from column names; clear them on long-format figures
+_PX_TITLE_RESET = dict(xaxis_title_text=None, legend_title_text=None)
+
+# Decomposition bar components in stacking order, with their colors and hover text
+_DECOMP_COLORS = {
+    'unabated_growth': 'rgba(128, 128, 128, 0.8)',
+    'genuine_decarb': 'rgba(46, 125, 50, 0.9)',
+    'dynamic_residual': 'rgba(255, 140, 0, 0.8)',
+    'carbon_removals': 'rgba(129, 199, 132, 0.8)',
+    'growth_limits': 'rgba(211, 47, 47, 0.8)'
+}
+_DECOMP_COMPONENTS = tuple(_DECOMP_COLORS)
+_DECOMP_TITLE = "Dynamic Net-Zero Transition Pathway<br><sub>Emissions decomposition with scenario-dependent removal requirements</sub>"
+_DECOMP_HOVER = {
+    'unabated_growth': '<b>Unabated Growth</b><br>Year: %{x}<br>Emissions: %{y:.0f} MtCO₂e<extra></extra>',
+    'genuine_decarb': '<b>Genuine Decarbonization</b><br>Year: %{x}<br>Reduction: %{y:.0f} MtCO₂e<extra></extra>',
+    'dynamic_residual': '<b>Dynamic Residuals</b><br>Year: %{x}<br>Residuals: %{y:.0f} MtCO₂e<extra></extra>',
+    'carbon_removals': '<b>Carbon Removals</b><br>Year: %{x}<br>Removals: %{y:.0f} MtCO₂e<extra></extra>',
+    'growth_limits': '<b>Growth Limits Alert</b><br>Year: %{x}<br>Alert: %{y:.0f} MtCO₂e<extra></extra>'
+}
+
+# Legend labels per component; the growth and decarbonization labels carry the slider values
+_DECOMP_LABELS = {
+    'unabated_growth': 'Unabated Growth<br>({growth_rate}% annually)',
+    'genuine_decarb': 'Genuine Decarbonization<br>({decarb_efficiency}% efficiency)',
+    'dynamic_residual': 'Dynamic Residual Emissions<br>(industry-specific constraints)',
+    'carbon_removals': 'Carbon Removals<br>(balancing residuals)',
+    'growth_limits': 'Planetary Boundary Alert<br>(unsustainable growth)'
 }
 
+# Milestone years of the 2030-2050 pathway, shared read-only by every cached result and used
+# as the x array of every time-series trace
+YEARS = np.arange(2030, 2055, 5)
+YEARS.flags.writeable = False
+
+# Comparison chart categories, from the SBTi static threshold to the user's settings
+_COMPARISON_SCENARIOS = ('SBTi Static 11%', 'Conservative RF2', 'Ambitious RF2', 'Your Settings')
+
+# Entry cap for every cache keyed on slider values, so sweeping the sliders cannot grow them without bound
+_SLIDER_CACHE_ENTRIES = 64
+
+# Illustrative company baseline (MtCO2e) and the static SBTi residual share
+BASELINE_EMISSIONS = 1000
+SBTI_STATIC_RESIDUAL = 0.11
+
+# Carbon price scenarios and their (low, high) price in $/tCO2
+CARBON_PRICE_SCENARIOS = {
+    "Conservative ($50-100/tCO2)": (50, 100),
+    "Moderate ($100-200/tCO2)": (100, 200),
+    "Aggressive ($200-400/tCO2)": (200, 400)
+}
+
+# Simulated intervention complexity, cycled by intervention order
+_COMPLEXITY_LEVELS = ('Low', 'Medium', 'High')
+
+# One hovertemplate shared by every intervention trace; per-point fields come from customdata
+_INTERVENTION_HOVER = (
+    '<b>%{fullData.name}</b><br>Timeline: %{x} years<br>'
+    'Potential: %{customdata[0]}-%{customdata[1]}%<br>Complexity: %{customdata[2]}<extra></extra>'
+)
+
+# Industry-independent interventions chart layout; a plain dict so reruns skip Plotly validation,
+# which only happens inside the cached figure builder
+_INTERVENTIONS_LAYOUT = dict(
+    title="Decarbonization Interventions: Timeline vs Potential",
+    xaxis_title="Implementation Timeline (Years)",
+    yaxis_title="Emission Reduction Potential (%)",
+    height=400
+)
+
+# Static page text with nothing to format: the summary box, the reference list and the footer
+_RF4_DELIVERS_MD = """
+    ### 🔬 Research Frontier 4 Delivers:
+    
+    - **Industry-specific thresholds** based on technical constraints
+    
+    - **Dynamic evolution** reflecting technological progress
+    
+    - **Integrated cost modeling** for optimal investment allocation
+    
+    - **Verification frameworks** preventing emission gaming
+    """
+
+_REFERENCES_MD = """
+### 📖 **Primary Scientific References**
+
+1. **IPCC AR6 Working Group III (2022)**: "Climate Change 2022: Mitigation of Climate Change" - Chapter 7: Agriculture, Forestry and Other Land Uses (AFOLU)
+2. **CDP (2022)**: "CDP Technical Note: Relevance of Scope 3 Categories by Sector"
+3. **Science Based Targets initiative (2025)**: "Corporate Net-Zero Standard Version 2.0: Consultation Draft"
+4. **McKinsey & Company (2024-2025)**: "The path to cost-effective decarbonization solutions" & "Retailers' climate road map"
+5. **World Resources Institute & Concordia University**: "Trends Show Companies Are Ready for Scope 3 Reporting"
+6. **Net-Zero Data Public Utility**: Corporate emissions and boundary analysis database
+7. **EPA Scope 3 Inventory Guidance (2025)**: Industry-specific emission factor frameworks
+"""
+
+_FOOTER_HTML = """
+---
+
+<div style='text-align: center; color: #666; font-size: 14px;'>
+<strong>Foundation for Planetary Action</strong> | Research Frontier 4: Dynamic Residual Emissions<br>
+Open-source tools for authentic corporate climate action | Built on peer-reviewed climate science | © 2024
+</div>
+"""
+
+
+def _decomposition_core(years, baseline_emissions, growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling):
+    """Pure NumPy decomposition kernel over an array of milestone years."""
+    i = np.arange(len(years))
+
+    # Business growth emissions
+    year_growth_factor = (1 + growth_rate/100) ** (5 * i)
+    growth_emissions = baseline_emissions * year_growth_factor - baseline_emissions
+
+    # Genuine decarbonization (negative)
+    genuine_reduction = -growth_emissions * (decarb_efficiency / 100)
+    unabated_growth = growth_emissions + genuine_reduction
+
+    # Dynamic residuals with industry-specific floor
+    base_residual = baseline_emissions * SBTI_STATIC_RESIDUAL
+    industry_floor = baseline_emissions * (biological_floor / 100)
+    # Constraint pressure ramps linearly from none in 2030 to the full factor in 2050
+    constraint_multiplier = np.linspace(1.0, constraint_factor, len(years))
+
+    dynamic_residual = np.maximum(industry_floor, base_residual * constraint_multiplier)
+
+    # Growth limits alert (planetary boundaries), increasing pressure from 2040
+    growth_limits = np.where(years >= 2040, -unabated_growth * 0.8, 0.0)
+
+    # Industry-specific benchmark (evolving)
+    benchmark = baseline_emissions * (1 - (tech_ceiling / 100)) * (1 + 0.1 * i)
+
+    unabated_growth = np.maximum(0, unabated_growth)
+
+    return unabated_growth, genuine_reduction, dynamic_residual, growth_limits, benchmark
+
+
+# Create enhanced dynamic decomposition
+@st.cache_data(max_entries=_SLIDER_CACHE_ENTRIES)
+def create_enhanced_decomposition(growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling,
+                                  baseline_emissions=BASELINE_EMISSIONS):
+    unabated_growth, genuine_reduction, dynamic_residual, growth_limits, benchmark = _decomposition_core(
+        YEARS, baseline_emissions, growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling
+    )
+    
+    # Carbon removals needed balance the residuals
+    carbon_removals = dynamic_residual
+    
+    return {
+        'year': YEARS,
+        'unabated_growth': unabated_growth,
+        'genuine_decarb': genuine_reduction,
+        'dynamic_residual': dynamic_residual,
+        'carbon_removals': carbon_removals,
+        'growth_limits': growth_limits,
+        'benchmark': benchmark,
+        'total_emissions': unabated_growth + dynamic_residual + carbon_removals
+    }
+
+
+@st.cache_data(max_entries=_SLIDER_CACHE_ENTRIES)
+def summarize_pathway(growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling, cost_per_ton):
+    """Headline scalars for the metrics and comparison, keyed on the scenario inputs."""
+    decomp_data = create_enhanced_decomposition(
+        growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling, BASELINE_EMISSIONS
+    )
+    final_residual = decomp_data['dynamic_residual'][-1]
+    final_removals = decomp_data['carbon_removals'][-1]
+    
+    return {
+        'final_residual': final_residual,
+        'residual_gap': final_residual - BASELINE_EMISSIONS * SBTI_STATIC_RESIDUAL,
+        'residual_pct': (final_residual / BASELINE_EMISSIONS) * 100,
+        'final_removals': final_removals,
+        'final_removal_cost': final_removals * cost_per_ton / 1000,
+        'total_decarb': abs(decomp_data['genuine_decarb'].sum())
+    }
+
+
+# Figure builders are cached as resources and shared across reruns and sessions,
+# so callers must not mutate the returned figures
+@st.cache_resource(max_entries=_SLIDER_CACHE_ENTRIES)
+def build_decomp_fig(industry, growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling):
+    decomp_data = create_enhanced_decomposition(
+        growth_rate, decarb_efficiency, constraint_factor, biological_floor, tech_ceiling, BASELINE_EMISSIONS
+    )
+    
+    # Create enhanced stacked bar chart, one trace per component from long-format data
+    long_data = {
+        'year': np.tile(decomp_data['year'], len(_DECOMP_COMPONENTS)),
+        'component': np.repeat(_DECOMP_COMPONENTS, len(decomp_data['year'])),
+        # float32 is ample for MtCO2e values; on these 20 bars it trims only about 80 bytes of payload
+        'value': np.concatenate([decomp_data[component] for component in _DECOMP_COMPONENTS], dtype=np.float32)
+    }
+    
+    fig = px.bar(
+        long_data, x='year', y='value', color='component',
+        color_discrete_map=_DECOMP_COLORS, barmode='relative'
+    )
+    fig.for_each_trace(lambda trace: trace.update(
+        name=_DECOMP_LABELS[trace.name].format(growth_rate=growth_rate, decarb_efficiency=decarb_efficiency),
+        hovertemplate=_DECOMP_HOVER[trace.name]
+    ))
+    
+    # Add dynamic benchmark line
+    fig.add_trace(go.Scatter(
+        x=YEARS,
+        y=decomp_data['benchmark'].astype(np.float32),
+        mode='lines+markers',
+        name='Industry-Specific Benchmark<br>(evolving threshold)',
+        line=dict(color='#000000', width=3, dash='dash'),
+        marker=dict(size=8, color='#000000'),
+        hovertemplate='<b>Industry Benchmark</b><br>Year: %{x}<br>Threshold: %{y:.0f} MtCO₂e<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        template=f"{pio.templates.default}+decomp",
+        # Defer axis and legend titles set by px.bar to the template
+        **_PX_TITLE_RESET,
+        yaxis_title_text=None,
+        # Keep zoom/pan while sliders change the data; reset it when the industry changes
+        uirevision=industry,
+        title=_DECOMP_TITLE,
+        # st.plotly_chart sizes the chart from the figure's own height, never the template's
+        height=650,
+        # px.bar pins margin.t to 60, which overrides any template value; restore the default
+        # 100 px band the two-line title and the industry annotation were laid out for
+        margin_t=100,
+        # Industry name as a subtitle annotation so the title itself never changes
+        annotations=[dict(
+            text=f"<b>{industry}</b>", xref='paper', yref='paper', x=0.5, y=1.05,
+            xanchor='center', yanchor='bottom', showarrow=False
+        )]
+    )
+    
+    return fig
+
+
+@st.cache_resource(max_entries=_SLIDER_CACHE_ENTRIES)
+def build_comparison_fig(industry, biological_floor, final_residual_pct):
+    # Create comparison of different approaches
+    static_residual = np.full(len(_COMPARISON_SCENARIOS), 11.0, dtype=np.float32)
+    your_settings = np.fromiter(
+        (11, biological_floor,
+         max(5, biological_floor*0.8),
+         final_residual_pct),
+        dtype=np.float32, count=len(_COMPARISON_SCENARIOS)
+    )
+    
+    approaches = {
+        'SBTi Static Approach': (static_residual, '#FF4B4B'),
+        'RF2 Dynamic Approach': (your_settings, '#00D4AA')
+    }
+    long_data = {
+        'scenario': np.tile(_COMPARISON_SCENARIOS, len(approaches)),
+        'approach': np.repeat(list(approaches), len(_COMPARISON_SCENARIOS)),
+        'residual': np.concatenate([values for values, _ in approaches.values()])
+    }
+    
+    fig = px.line(
+        long_data, x='scenario', y='residual', color='approach', markers=True,
+        color_discrete_map={name: color for name, (_, color) in approaches.items()}
+    )
+    # Drawn as a static plot, so the hover text px.line generates is never shown
+    fig.update_traces(line_width=4, marker_size=12, hovertemplate=None, hoverinfo='skip')
+    
+    fig.update_layout(
+        title=f"{industry}: Residual Emissions Evolution Across Approaches",
+        **_PX_TITLE_RESET,
+        yaxis_title="Residual Emissions (%)",
+        height=400,
+        showlegend=True
+    )
+    
+    return fig
+
+
+# Calculate economic impacts
+@st.cache_data(max_entries=_SLIDER_CACHE_ENTRIES)
+def calculate_economics(decomp_data, cost_per_ton, carbon_price_scenario):
+    price_range = CARBON_PRICE_SCENARIOS[carbon_price_scenario]
+
+    # Carbon removal costs (Billions) at both ends of the price range, broadcast in one pass
+    removal_cost_low, removal_cost_high = np.multiply.outer(price_range, decomp_data['carbon_removals']) / 1000
+
+    return {
+        'year': decomp_data['year'],
+        'removal_cost_low': removal_cost_low,
+        'removal_cost_high': removal_cost_high,
+        # Investment in genuine decarbonization
+        'decarb_investment': np.abs(decomp_data['genuine_decarb']) * cost_per_ton / 1000,
+        # Cost of inaction (simplified), with a premium for inaction
+        'inaction_cost': decomp_data['unabated_growth'] * price_range[1] * 1.5 / 1000
+    }
+
+
+@st.cache_resource(max_entries=_SLIDER_CACHE_ENTRIES)
+def build_econ_fig(industry, econ_data):
+    # Create economic visualization
+    fig_econ = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Investment Requirements Over Time', 'Cumulative Cost Comparison'),
+        vertical_spacing=0.12
+    )
+    
+    # Cumulative costs, accumulated for both series in one pass over a stacked array
+    cumulative_decarb, cumulative_removal = np.cumsum(
+        np.vstack((econ_data['decarb_investment'], econ_data['removal_cost_low'])), axis=1
+    )
+    
+    # Annual costs on the top row, cumulative costs on the bottom, added in one batch
+    fig_econ.add_traces(
+        [
+            go.Bar(x=YEARS, y=econ_data['decarb_investment'], 
+                   name='Decarbonization Investment', marker_color='#2E7D32'),
+            go.Bar(x=YEARS, y=econ_data['removal_cost_low'], 
+                   name='Carbon Removal (Low)', marker_color='#81C784'),
+            go.Bar(x=YEARS, y=econ_data['inaction_cost'], 
+                   name='Cost of Inaction', marker_color='#D32F2F'),
+            go.Scatter(x=YEARS, y=cumulative_decarb, 
+                       name='Cumulative Decarbonization', line=dict(color='#2E7D32', width=3)),
+            go.Scatter(x=YEARS, y=cumulative_removal, 
+                       name='Cumulative Removals', line=dict(color='#81C784', width=3))
+        ],
+        rows=[1, 1, 1, 2, 2], cols=1
+    )
+    
+    # Subplot axis titles go in the same layout update: row 1 uses xaxis/yaxis, row 2 xaxis2/yaxis2
+    fig_econ.update_layout(
+        height=700, title_text=f"Economic Analysis: {industry} Net-Zero Pathway", uirevision=industry,
+        xaxis2_title_text="Year",
+        yaxis_title_text="Annual Cost ($B)",
+        yaxis2_title_text="Cumulative Cost ($B)"
+    )
+    
+    return fig_econ
+
+
+@st.cache_data
+def build_intervention_table(key_interventions):
+    # Simulate intervention potential from each intervention's position
+    i = np.arange(len(key_interventions))
+    
+    return pd.DataFrame({
+        'Intervention': list(key_interventions),
+        'Potential_Min': 30 + i * 10,
+        'Potential_Max': 60 + i * 15,
+        'Timeline_Years': 5 + i * 3,
+        'Complexity': np.take(_COMPLEXITY_LEVELS, i % len(_COMPLEXITY_LEVELS))
+    })
+
+
+@st.cache_resource
+def build_interventions_fig(key_interventions):
+    df_interventions = build_intervention_table(key_interventions)
+    
+    # Each intervention is a vertical segment from its minimum to maximum potential,
+    # passed to Plotly as array rows rather than per-row Python lists
+    segment_x = np.repeat(df_interventions['Timeline_Years'].to_numpy()[:, np.newaxis], 2, axis=1)
+    segment_y = df_interventions[['Potential_Min', 'Potential_Max']].to_numpy()
+    # Both ends of a segment carry the intervention's hover fields for the shared template
+    segment_hover = np.repeat(
+        df_interventions[['Potential_Min', 'Potential_Max', 'Complexity']].to_numpy()[:, np.newaxis], 2, axis=1
+    )
+    
+    # Create intervention potential chart with all traces passed to the constructor at once
+    fig_interventions = go.Figure(data=[
+        go.Scatter(
+            x=x,
+            y=y,
+            mode='lines+markers',
+            name=name,
+            customdata=hover_data,
+            hovertemplate=_INTERVENTION_HOVER
+        )
+        for name, x, y, hover_data in zip(df_interventions['Intervention'], segment_x, segment_y, segment_hover)
+    ], layout=_INTERVENTIONS_LAYOUT)
+    fig_interventions.update_traces(line_width=8, marker_size=12)
+    
+    return fig_interventions
+
+
+@st.cache_data
+def get_profile_markdown(industry):
+    """Deep-dive profile text for an industry, formatted once per industry."""
+    industry_data = get_industry_profiles()[industry]
+    return f"""
+    ### {industry} Profile
+    
+    **Scope 3 Dominance**: {industry_data['scope3_pct']}% of emissions beyond direct control
+    
+    **Primary Constraint**: {industry_data['main_constraint']}
+    
+    **Technical Ceiling**: {industry_data['tech_ceiling']}% maximum reduction potential
+    
+    **Biological/Physical Floor**: {industry_data['biological_floor']}% minimum residual emissions
+    
+    ### 🛠️ Key Decarbonization Interventions
+    """
+
+
+@st.cache_data
+def get_constraint_markdown(industry):
+    """Constraint mapping text for an industry, formatted once per industry."""
+    return (
+        "### 🎯 Why Static 11% Fails: Constraint Mapping\n\n"
+        + "\n\n".join(f"• {reason}" for reason in get_industry_profiles()[industry]['constraint_reasons'])
+    )
+
+
 # Sidebar controls
 st.sidebar.header("🎛️ Dynamic Scenario Controls")
 st.sidebar.markdown("*Adjust parameters to see how RF2 constraints affect RF4 residuals*")
@@ -81,7 +548,7 @@ st.sidebar.markdown("*Adjust parameters to see how RF2 constraints affect RF4 re
 # Industry selection
 selected_industry = st.sidebar.selectbox(
     "Select Industry:",
-    list(industry_profiles.keys())
+    INDUSTRIES
 )
 
 industry_data = industry_profiles[selected_industry]
@@ -118,7 +585,7 @@ global_constraint_factor = st.sidebar.slider(
 
 carbon_price_trajectory = st.sidebar.selectbox(
     "Carbon Price Scenario",
-    ["Conservative ($50-100/tCO2)", "Moderate ($100-200/tCO2)", "Aggressive ($200-400/tCO2)"],
+    tuple(CARBON_PRICE_SCENARIOS),
     index=1
 )
 
@@ -128,203 +595,66 @@ tab1, tab2, tab3, tab4 = st.tabs(["📊 Dynamic Decomposition", "🎮 Scenario C
 with tab1:
     st.subheader("📊 Interactive Corporate Net-Zero Pathway (2030-2050)")
     
-    # Create enhanced dynamic decomposition
-    def create_enhanced_decomposition(growth_rate, decarb_efficiency, constraint_factor, industry_data):
-        years = np.arange(2030, 2055, 5)
-        baseline_emissions = 1000  # MtCO2e
-        
-        results = []
-        cumulative_growth = 1.0
-        
-        for i, year in enumerate(years):
-            year_growth_factor = (1 + growth_rate/100) ** (5 * i) if i > 0 else 1.0
-            
-            # Business growth emissions
-            total_business_emissions = baseline_emissions * year_growth_factor
-            growth_emissions = total_business_emissions - baseline_emissions
-            
-            # Genuine decarbonization (negative)
-            genuine_reduction = -growth_emissions * (decarb_efficiency / 100)
-            unabated_growth = growth_emissions + genuine_reduction
-            
-            # Dynamic residuals with industry-specific floor
-            base_residual = baseline_emissions * 0.11  # Static SBTi assumption
-            industry_floor = baseline_emissions * (industry_data['biological_floor'] / 100)
-            constraint_multiplier = 1 + (constraint_factor - 1) * (i / (len(years) - 1))
-            
-            dynamic_residual = max(industry_floor, base_residual * constraint_multiplier)
-            
-            # Carbon removals needed
-            carbon_removals = dynamic_residual
-            
-            # Growth limits alert (planetary boundaries)
-            if year >= 2040:
-                growth_limits = -unabated_growth * 0.8  # Increasing pressure
-            else:
-                growth_limits = 0
-            
-            # Industry-specific benchmark (evolving)
-            benchmark = baseline_emissions * (1 - (industry_data['tech_ceiling'] / 100)) * (1 + 0.1 * i)
-            
-            results.append({
-                'year': year,
-                'unabated_growth': max(0, unabated_growth),
-                'genuine_decarb': genuine_reduction,
-                'dynamic_residual': dynamic_residual,
-                'carbon_removals': carbon_removals,
-                'growth_limits': growth_limits,
-                'benchmark': benchmark,
-                'total_emissions': max(0, unabated_growth) + dynamic_residual + carbon_removals
-            })
-        
-        return pd.DataFrame(results)
-    
-    decomp_data = create_enhanced_decomposition(growth_rate, decarb_efficiency, global_constraint_factor, industry_data)
-    
-    # Create enhanced stacked bar chart
-    fig_decomp = go.Figure()
-    
-    # Add stacked bars
-    fig_decomp.add_trace(go.Bar(
-        x=decomp_data['year'],
-        y=decomp_data['unabated_growth'],
-        name=f'Unabated Growth<br>({growth_rate}% annually)',
-        marker_color='rgba(128, 128, 128, 0.8)',
-        hovertemplate='<b>Unabated Growth</b><br>Year: %{x}<br>Emissions: %{y:.0f} MtCO₂e<extra></extra>'
-    ))
-    
-    fig_decomp.add_trace(go.Bar(
-        x=decomp_data['year'],
-        y=decomp_data['genuine_decarb'],
-        name=f'Genuine Decarbonization<br>({decarb_efficiency}% efficiency)',
-        marker_color='rgba(46, 125, 50, 0.9)',
-        hovertemplate='<b>Genuine Decarbonization</b><br>Year: %{x}<br>Reduction: %{y:.0f} MtCO₂e<extra></extra>'
-    ))
-    
-    fig_decomp.add_trace(go.Bar(
-        x=decomp_data['year'],
-        y=decomp_data['dynamic_residual'],
-        name='Dynamic Residual Emissions<br>(industry-specific constraints)',
-        marker_color='rgba(255, 140, 0, 0.8)',
-        hovertemplate='<b>Dynamic Residuals</b><br>Year: %{x}<br>Residuals: %{y:.0f} MtCO₂e<extra></extra>'
-    ))
-    
-    fig_decomp.add_trace(go.Bar(
-        x=decomp_data['year'],
-        y=decomp_data['carbon_removals'],
-        name='Carbon Removals<br>(balancing residuals)',
-        marker_color='rgba(129, 199, 132, 0.8)',
-        hovertemplate='<b>Carbon Removals</b><br>Year: %{x}<br>Removals: %{y:.0f} MtCO₂e<extra></extra>'
-    ))
-    
-    fig_decomp.add_trace(go.Bar(
-        x=decomp_data['year'],
-        y=decomp_data['growth_limits'],
-        name='Planetary Boundary Alert<br>(unsustainable growth)',
-        marker_color='rgba(211, 47, 47, 0.8)',
-        hovertemplate='<b>Growth Limits Alert</b><br>Year: %{x}<br>Alert: %{y:.0f} MtCO₂e<extra></extra>'
-    ))
-    
-    # Add dynamic benchmark line
-    fig_decomp.add_trace(go.Scatter(
-        x=decomp_data['year'],
-        y=decomp_data['benchmark'],
-        mode='lines+markers',
-        name='Industry-Specific Benchmark<br>(evolving threshold)',
-        line=dict(color='#000000', width=3, dash='dash'),
-        marker=dict(size=8, color='#000000'),
-        hovertemplate='<b>Industry Benchmark</b><br>Year: %{x}<br>Threshold: %{y:.0f} MtCO₂e<extra></extra>'
-    ))
+    decomp_data = create_enhanced_decomposition(
+        growth_rate, decarb_efficiency, global_constraint_factor,
+        industry_data['biological_floor'], industry_data['tech_ceiling'], BASELINE_EMISSIONS
+    )
     
-    fig_decomp.update_layout(
-        title=f"{selected_industry}: Dynamic Net-Zero Transition Pathway<br><sub>Emissions decomposition with scenario-dependent removal requirements</sub>",
-        xaxis_title="Year",
-        yaxis_title="MtCO₂e (Positive = Emissions, Negative = Removals)",
-        height=650,
-        barmode='relative',
-        legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.05),
-        hovermode='x unified'
+    fig_decomp = build_decomp_fig(
+        selected_industry, growth_rate, decarb_efficiency, global_constraint_factor,
+        industry_data['biological_floor'], industry_data['tech_ceiling']
     )
     
     st.plotly_chart(fig_decomp, use_container_width=True)
     
     # Key metrics display
-    col1, col2, col3, col4 = st.columns(4)
+    pathway_summary = summarize_pathway(
+        growth_rate, decarb_efficiency, global_constraint_factor,
+        industry_data['biological_floor'], industry_data['tech_ceiling'], industry_data['cost_per_ton']
+    )
     
-    final_year_data = decomp_data.iloc[-1]
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(
             "2050 Residual Emissions",
-            f"{final_year_data['dynamic_residual']:.0f} MtCO₂e",
-            delta=f"{final_year_data['dynamic_residual'] - 110:.0f} vs static 11%"
+            f"{pathway_summary['final_residual']:.0f} MtCO₂e",
+            delta=f"{pathway_summary['residual_gap']:.0f} vs static 11%"
         )
     
     with col2:
         st.metric(
             "Carbon Removals Needed",
-            f"{final_year_data['carbon_removals']:.0f} MtCO₂e",
-            delta=f"${final_year_data['carbon_removals'] * industry_data['cost_per_ton']/1000:.1f}B cost"
+            f"{pathway_summary['final_removals']:.0f} MtCO₂e",
+            delta=f"${pathway_summary['final_removal_cost']:.1f}B cost"
         )
     
     with col3:
-        total_decarb = abs(decomp_data['genuine_decarb'].sum())
         st.metric(
             "Cumulative Decarbonization",
-            f"{total_decarb:.0f} MtCO₂e",
+            f"{pathway_summary['total_decarb']:.0f} MtCO₂e",
             delta=f"{decarb_efficiency}% efficiency"
         )
     
     with col4:
-        industry_residual_pct = (final_year_data['dynamic_residual'] / 1000) * 100
         st.metric(
             "Industry-Specific Residual %",
-            f"{industry_residual_pct:.1f}%",
-            delta=f"{industry_residual_pct - 11:.1f}% vs SBTi static"
+            f"{pathway_summary['residual_pct']:.1f}%",
+            delta=f"{pathway_summary['residual_pct'] - 11:.1f}% vs SBTi static"
         )
 
 with tab2:
     st.subheader("🎮 Scenario Comparison: Static vs Dynamic Approaches")
     
-    # Create comparison of different approaches
-    scenarios = ['SBTi Static 11%', 'Conservative RF2', 'Ambitious RF2', 'Your Settings']
-    static_residual = [11, 11, 11, 11]
-    rf2_conservative = [industry_data['biological_floor'], industry_data['biological_floor'], 
-                       industry_data['biological_floor'], industry_data['biological_floor']]
-    rf2_ambitious = [industry_data['biological_floor']*0.7, industry_data['biological_floor']*0.7,
-                     industry_data['biological_floor']*0.7, industry_data['biological_floor']*0.7]
-    your_settings = [11, industry_data['biological_floor'], 
-                     max(5, industry_data['biological_floor']*0.8), 
-                     (final_year_data['dynamic_residual'] / 1000) * 100]
-    
-    fig_comparison = go.Figure()
-    
-    fig_comparison.add_trace(go.Scatter(
-        x=scenarios,
-        y=static_residual,
-        mode='lines+markers',
-        name='SBTi Static Approach',
-        line=dict(color='#FF4B4B', width=4),
-        marker=dict(size=12)
-    ))
-    
-    fig_comparison.add_trace(go.Scatter(
-        x=scenarios,
-        y=your_settings,
-        mode='lines+markers',
-        name='RF2 Dynamic Approach',
-        line=dict(color='#00D4AA', width=4),
-        marker=dict(size=12)
-    ))
-    
-    fig_comparison.update_layout(
-        title=f"{selected_industry}: Residual Emissions Evolution Across Approaches",
-        yaxis_title="Residual Emissions (%)",
-        height=400,
-        showlegend=True
+    fig_comparison = build_comparison_fig(
+        selected_industry, industry_data['biological_floor'], pathway_summary['residual_pct']
     )
     
-    st.plotly_chart(fig_comparison, use_container_width=True)
+    # Illustrative four-point comparison; a static plot skips hover and drag handlers
+    st.plotly_chart(
+        fig_comparison, use_container_width=True,
+        config={'staticPlot': True, 'displayModeBar': False}
+    )
     
     # Impact assessment
     st.markdown("### 📈 Impact of Dynamic vs Static Approaches")
@@ -354,92 +684,9 @@ with tab2:
 with tab3:
     st.subheader("💰 Economic Implications of Dynamic Residuals")
     
-    # Calculate economic impacts
-    def calculate_economics(decomp_data, industry_data, carbon_price_scenario):
-        price_mapping = {
-            "Conservative ($50-100/tCO2)": (50, 100),
-            "Moderate ($100-200/tCO2)": (100, 200),
-            "Aggressive ($200-400/tCO2)": (200, 400)
-        }
-        
-        price_range = price_mapping[carbon_price_scenario]
-        
-        economics_data = []
-        
-        for _, row in decomp_data.iterrows():
-            year = row['year']
-            
-            # Carbon removal costs
-            removal_cost_low = row['carbon_removals'] * price_range[0] / 1000  # Billions
-            removal_cost_high = row['carbon_removals'] * price_range[1] / 1000
-            
-            # Investment in genuine decarbonization
-            decarb_investment = abs(row['genuine_decarb']) * industry_data['cost_per_ton'] / 1000
-            
-            # Cost of inaction (simplified)
-            inaction_cost = row['unabated_growth'] * price_range[1] * 1.5 / 1000  # Premium for inaction
-            
-            economics_data.append({
-                'year': year,
-                'removal_cost_low': removal_cost_low,
-                'removal_cost_high': removal_cost_high,
-                'decarb_investment': decarb_investment,
-                'inaction_cost': inaction_cost
-            })
-        
-        return pd.DataFrame(economics_data)
-    
-    econ_data = calculate_economics(decomp_data, industry_data, carbon_price_trajectory)
-    
-    # Create economic visualization
-    fig_econ = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=('Investment Requirements Over Time', 'Cumulative Cost Comparison'),
-        vertical_spacing=0.12
-    )
-    
-    # Annual costs
-    fig_econ.add_trace(
-        go.Bar(x=econ_data['year'], y=econ_data['decarb_investment'], 
-               name='Decarbonization Investment', marker_color='#2E7D32'),
-        row=1, col=1
-    )
-    
-    fig_econ.add_trace(
-        go.Bar(x=econ_data['year'], y=econ_data['removal_cost_low'], 
-               name='Carbon Removal (Low)', marker_color='#81C784'),
-        row=1, col=1
-    )
+    econ_data = calculate_economics(decomp_data, industry_data['cost_per_ton'], carbon_price_trajectory)
     
-    fig_econ.add_trace(
-        go.Bar(x=econ_data['year'], y=econ_data['inaction_cost'], 
-               name='Cost of Inaction', marker_color='#D32F2F'),
-        row=1, col=1
-    )
-    
-    # Cumulative costs
-    cumulative_decarb = econ_data['decarb_investment'].cumsum()
-    cumulative_removal = econ_data['removal_cost_low'].cumsum()
-    cumulative_inaction = econ_data['inaction_cost'].cumsum()
-    
-    fig_econ.add_trace(
-        go.Scatter(x=econ_data['year'], y=cumulative_decarb, 
-                   name='Cumulative Decarbonization', line=dict(color='#2E7D32', width=3)),
-        row=2, col=1
-    )
-    
-    fig_econ.add_trace(
-        go.Scatter(x=econ_data['year'], y=cumulative_removal, 
-                   name='Cumulative Removals', line=dict(color='#81C784', width=3)),
-        row=2, col=1
-    )
-    
-    fig_econ.update_layout(height=700, title_text=f"Economic Analysis: {selected_industry} Net-Zero Pathway")
-    fig_econ.update_xaxes(title_text="Year", row=2, col=1)
-    fig_econ.update_yaxes(title_text="Annual Cost ($B)", row=1, col=1)
-    fig_econ.update_yaxes(title_text="Cumulative Cost ($B)", row=2, col=1)
-    
-    st.plotly_chart(fig_econ, use_container_width=True)
+    st.plotly_chart(build_econ_fig(selected_industry, econ_data), use_container_width=True)
     
     # Economic insights
     total_decarb_cost = econ_data['decarb_investment'].sum()
@@ -486,96 +733,15 @@ with tab3:
 with tab4:
     st.subheader("🔍 Deep Dive: Industry-Specific Constraints Analysis")
     
-    st.markdown(f"""
-    ### {selected_industry} Profile
-    
-    **Scope 3 Dominance**: {industry_data['scope3_pct']}% of emissions beyond direct control
-    
-    **Primary Constraint**: {industry_data['main_constraint']}
-    
-    **Technical Ceiling**: {industry_data['tech_ceiling']}% maximum reduction potential
-    
-    **Biological/Physical Floor**: {industry_data['biological_floor']}% minimum residual emissions
-    """)
+    st.markdown(get_profile_markdown(selected_industry))
     
     # Intervention analysis
-    st.markdown("### 🛠️ Key Decarbonization Interventions")
-    
-    intervention_data = []
-    for i, intervention in enumerate(industry_data['key_interventions']):
-        # Simulate intervention potential
-        potential_min = 30 + i * 10
-        potential_max = 60 + i * 15
-        timeline_years = 5 + i * 3
-        
-        intervention_data.append({
-            'Intervention': intervention,
-            'Potential_Min': potential_min,
-            'Potential_Max': potential_max,
-            'Timeline_Years': timeline_years,
-            'Complexity': ['Low', 'Medium', 'High'][i % 3]
-        })
-    
-    df_interventions = pd.DataFrame(intervention_data)
-    
-    # Create intervention potential chart
-    fig_interventions = go.Figure()
-    
-    for idx, row in df_interventions.iterrows():
-        fig_interventions.add_trace(go.Scatter(
-            x=[row['Timeline_Years'], row['Timeline_Years']],
-            y=[row['Potential_Min'], row['Potential_Max']],
-            mode='lines+markers',
-            name=row['Intervention'],
-            line=dict(width=8),
-            marker=dict(size=12),
-            hovertemplate=f"<b>{row['Intervention']}</b><br>" +
-                         f"Timeline: {row['Timeline_Years']} years<br>" +
-                         f"Potential: {row['Potential_Min']}-{row['Potential_Max']}%<br>" +
-                         f"Complexity: {row['Complexity']}<extra></extra>"
-        ))
-    
-    fig_interventions.update_layout(
-        title="Decarbonization Interventions: Timeline vs Potential",
-        xaxis_title="Implementation Timeline (Years)",
-        yaxis_title="Emission Reduction Potential (%)",
-        height=400
-    )
+    fig_interventions = build_interventions_fig(tuple(industry_data['key_interventions']))
     
     st.plotly_chart(fig_interventions, use_container_width=True)
     
     # Constraint mapping
-    st.markdown("### 🎯 Why Static 11% Fails: Constraint Mapping")
-    
-    constraint_reasons = {
-        'Food, Beverage & Tobacco': [
-            "Biological methane emissions from ruminants have physical floors",
-            "Seasonal agricultural cycles create supply chain variability", 
-            "Food safety packaging requirements limit material substitution",
-            "Global supply chains span multiple climate zones"
-        ],
-        'Capital Goods': [
-            "Equipment lifespans of 20-30 years beyond manufacturer control",
-            "Use-phase emissions depend on customer operational decisions",
-            "Technology evolution varies dramatically by end-use sector",
-            "Heavy industrial applications have limited electrification options"
-        ],
-        'Consumer Goods': [
-            "Consumer behavior patterns resist company influence",
-            "Food safety and shelf-life requirements constrain packaging",
-            "Global material supply chains have embedded constraints",
-            "End-of-life waste management varies by geography"
-        ],
-        'Financial Services': [
-            "Portfolio emissions reflect weighted average of ALL sectors",
-            "Each sector has different maximum decarbonization potential",
-            "Indirect influence through capital allocation, not direct control",
-            "Regulatory constraints limit divestment speed"
-        ]
-    }
-    
-    for reason in constraint_reasons[selected_industry]:
-        st.markdown(f"• {reason}")
+    st.markdown(get_constraint_markdown(selected_industry))
 
 # Key insights summary
 st.markdown("---")
@@ -597,17 +763,7 @@ with summary_col1:
     """)
 
 with summary_col2:
-    st.info(f"""
-    ### 🔬 Research Frontier 4 Delivers:
-    
-    - **Industry-specific thresholds** based on technical constraints
-    
-    - **Dynamic evolution** reflecting technological progress
-    
-    - **Integrated cost modeling** for optimal investment allocation
-    
-    - **Verification frameworks** preventing emission gaming
-    """)
+    st.info(_RF4_DELIVERS_MD)
 
 # Scientific Sources & Methodology
 st.markdown("---")
@@ -693,22 +849,7 @@ with st.expander("🎯 **Dynamic Residuals vs Static SBTi Approach**"):
     """)
 
 # Key References
-st.markdown("### 📖 **Primary Scientific References**")
-st.markdown("""
-1. **IPCC AR6 Working Group III (2022)**: "Climate Change 2022: Mitigation of Climate Change" - Chapter 7: Agriculture, Forestry and Other Land Uses (AFOLU)
-2. **CDP (2022)**: "CDP Technical Note: Relevance of Scope 3 Categories by Sector"
-3. **Science Based Targets initiative (2025)**: "Corporate Net-Zero Standard Version 2.0: Consultation Draft"
-4. **McKinsey & Company (2024-2025)**: "The path to cost-effective decarbonization solutions" & "Retailers' climate road map"
-5. **World Resources Institute & Concordia University**: "Trends Show Companies Are Ready for Scope 3 Reporting"
-6. **Net-Zero Data Public Utility**: Corporate emissions and boundary analysis database
-7. **EPA Scope 3 Inventory Guidance (2025)**: Industry-specific emission factor frameworks
-""")
+st.markdown(_REFERENCES_MD)
 
 # Footer
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666; font-size: 14px;'>
-<strong>Foundation for Planetary Action</strong> | Research Frontier 4: Dynamic Residual Emissions<br>
-Open-source tools for authentic corporate climate action | Built on peer-reviewed climate science | © 2024
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)